@@ -3,6 +3,7 @@ Tools to allow users to place custom meshes on a building
 """
 import bpy
 import bmesh
+import numpy as np
 from mathutils import Matrix, Vector
 from bpy.props import PointerProperty
 
@@ -193,12 +194,10 @@ def calc_verts_bounds(verts):
     """ Determine the bounds size of the verts
     (assumes verts(mesh) is facing forward(y+))
     """
-    sort_x = sorted([v.co.x for v in verts])
-    sort_y = sorted([v.co.y for v in verts])
-    sort_z = sorted([v.co.z for v in verts])
-    width = sort_x[-1] - sort_x[0]
-    height = sort_z[-1] - sort_z[1]
-    depth = sort_y[-1] - sort_y[1]
+    co = np.fromiter(
+        (c for v in verts for c in v.co), dtype=np.float64, count=len(verts) * 3
+    ).reshape(-1, 3)
+    width, depth, height = co.max(axis=0) - co.min(axis=0)
     return width, height, depth
 
 
@@ -86,7 +86,7 @@ def fill_panel(bm, face, prop):
         return
 
     # XXX Ensure panel border is less than parent face size
-    min_dimension = min(calc_face_dimensions(face))
+    min_dimension = min(width, height)
     prop.panel_border_size = min(
         prop.panel_border_size, min_dimension / 2)
 
@@ -144,6 +144,7 @@ def fill_bar(bm, face, prop):
         return
 
     xyz = local_xyz(face)
+    normal = xyz[2]
     face_center = face.calc_center_median()
     width, height = calc_face_dimensions(face)
 
@@ -158,8 +159,10 @@ def fill_bar(bm, face, prop):
         Matrix.Rotation(-VEC_UP.angle(xyz[1]), 4, xyz[0]) @ Matrix.Translation(-face_center)
     )
 
+    bars = []
+
     # -- horizontal
-    depth = face.normal * prop.bar_depth
+    depth = normal * prop.bar_depth
     offset = height / (prop.bar_count_x + 1)
     for i in range(prop.bar_count_x):
         item_off = Vector((0, 0, -height / 2 + (i + 1) * offset))
@@ -167,19 +170,21 @@ def fill_bar(bm, face, prop):
             Matrix.Translation(depth + item_off) @
             Matrix.Scale(prop.bar_width / height, 4, VEC_UP)
         )
-        create_bar_from_face(bm, face, transform, transform_space, -depth)
+        bars.append((transform, -depth, False))
 
     # -- vertical
     eps = 0.015
     offset = width / (prop.bar_count_y + 1)
-    depth = face.normal * (prop.bar_depth - eps)
+    depth = normal * (prop.bar_depth - eps)
     for i in range(prop.bar_count_y):
         item_off = xyz[0] * (-width / 2 + ((i + 1) * offset))
         transform = (
             Matrix.Translation(depth + item_off) @
             Matrix.Scale(prop.bar_width / width, 4, xyz[0])
         )
-        create_bar_from_face(bm, face, transform, transform_space, -depth, True)
+        bars.append((transform, -depth, True))
+
+    create_bars_from_face(bm, face, bars, transform_space)
 
 
 def fill_louver(bm, face, prop, user=FillUser.DOOR):
@@ -197,14 +202,12 @@ def fill_louver(bm, face, prop, user=FillUser.DOOR):
     faces.sort(key=lambda f: f.calc_center_median().z)
     louver_faces = faces[1::2]
 
-    # -- scale to border
-    for face in louver_faces:
-        bmesh.ops.scale(
-            bm,
-            vec=(1, 1, 1 + prop.louver_border),
-            verts=face.verts,
-            space=Matrix.Translation(-face.calc_center_median()),
-        )
+    # -- scale to border, each louver vertically about its own center
+    scale = 1 + prop.louver_border
+    centers = [f.calc_center_median().z for f in louver_faces]
+    for face, cz in zip(louver_faces, centers):
+        for v in face.verts:
+            v.co.z = cz + (v.co.z - cz) * scale
 
     usergroup = [FaceMap.WINDOW_LOUVERS, FaceMap.DOOR_LOUVERS][user == FillUser.DOOR]
     extrude = map_new_faces(usergroup)(extrude_faces_add_slope)
@@ -217,43 +220,48 @@ def subdivide_face_into_quads(bm, face, cuts_x, cuts_y):
     """
     v_edges = filter_vertical_edges(face.edges)
     h_edges = filter_horizontal_edges(face.edges)
+    region_verts = {v for fv in face.verts for f in fv.link_faces for v in f.verts}
 
     edges = []
     if cuts_x > 0:
         res = bmesh.ops.subdivide_edges(bm, edges=v_edges, cuts=cuts_x)
         edges.extend(filter_geom(res["geom_inner"], BMEdge))
+        region_verts.update(filter_geom(res["geom"], BMVert))
 
     if cuts_y > 0:
         res = bmesh.ops.subdivide_edges(bm, edges=h_edges + edges, cuts=cuts_y)
         edges.extend(filter_geom(res["geom_inner"], BMEdge))
-    bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=0.01)
+        region_verts.update(filter_geom(res["geom"], BMVert))
+    bmesh.ops.remove_doubles(bm, verts=validate(region_verts), dist=0.01)
     return list({f for ed in validate(edges) for f in ed.link_faces})
 
 
-def create_bar_from_face(bm, face, trans, trans_space, depth, vertical=False):
-    """Create bar geometry from a face
-    """
-    dup = duplicate_face_translate_scale(bm, face, trans, trans_space).get("geom")
-    edges = [filter_horizontal_edges, filter_vertical_edges][vertical](
-        filter_geom(dup, BMEdge)
-    )
-    extrude_edges_to_depth(bm, edges, depth)
-
-
-def duplicate_face_translate_scale(bm, face, trans, trans_space):
-    """Duplicate a face and transform it
-    """
-    ret = bmesh.ops.duplicate(bm, geom=[face])
-    verts = filter_geom(ret["geom"], BMVert)
-    bmesh.ops.transform(bm, verts=verts, matrix=trans, space=trans_space)
-    return ret
-
-
-def extrude_edges_to_depth(bm, edges, depth):
-    """Extrude edges only and translate
+def create_bars_from_face(bm, face, bars, trans_space):
+    """Create bar geometry from a face for each (transform, depth, vertical) in bars
     """
-    ext = bmesh.ops.extrude_edge_only(bm, edges=edges)
-    bmesh.ops.translate(bm, verts=filter_geom(ext["geom"], BMVert), vec=depth)
+    # -- edges to extrude are the same for every copy of face, classify them once
+    h_edges = set(filter_horizontal_edges(face.edges))
+    v_edges = set(filter_vertical_edges(face.edges))
+    loops = [(l.vert, l.link_loop_next.vert, l.edge) for l in face.loops]
+
+    space_inv = trans_space.inverted()
+    new_vert, new_face = bm.verts.new, bm.faces.new
+    for trans, depth, vertical in bars:
+        # -- transformed copy of face
+        mat = space_inv @ trans @ trans_space
+        front = {v: new_vert(mat @ v.co) for v in face.verts}
+        new_face([front[v] for v in face.verts], face)
+
+        # -- side faces from edges pushed back by depth
+        back = {}
+        extrude_edges = v_edges if vertical else h_edges
+        for a, b, edge in loops:
+            if edge not in extrude_edges:
+                continue
+            for v in (a, b):
+                if v not in back:
+                    back[v] = new_vert(front[v].co + depth)
+            new_face((front[b], front[a], back[a], back[b]), face)
 
 
 def extrude_faces_add_slope(bm, faces, extrude_normal, extrude_depth):
@@ -169,13 +169,18 @@ def random_scale_and_translate(bm, middle_edge):
 
     axis = VEC_RIGHT if verts[0].co.y == verts[1].co.y else VEC_FORWARD
     scale_factor = clamp(random.random() * 3, 1, 2.95)
-    bmesh.ops.scale(
-        bm, verts=verts, vec=axis * scale_factor, space=Matrix.Translation(-median)
-    )
-
+    rand_offset = 0.0
     if random.choice([0, 1]):
         rand_offset = random.random() * length
-        bmesh.ops.translate(bm, verts=verts, vec=axis * rand_offset)
+
+    # -- scale about the median and offset in a single transform
+    transform = (
+        Matrix.Translation(axis * rand_offset) @
+        Matrix.Diagonal((*(axis * scale_factor), 1.0))
+    )
+    bmesh.ops.transform(
+        bm, verts=verts, matrix=transform, space=Matrix.Translation(-median)
+    )
 
 
 def random_extrude(bm, middle_edge, direction):
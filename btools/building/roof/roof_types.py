@@ -1,15 +1,15 @@
+import math
+from collections import defaultdict
+
 import bmesh
-import mathutils
 import numpy as np
 from bmesh.types import BMVert, BMFace
-from mathutils import Vector
 
 from ...utils import (
     equal,
     select,
     FaceMap,
     validate,
-    edge_vector,
     skeletonize,
     filter_geom,
     map_new_faces,
@@ -152,7 +152,12 @@ def create_hip_roof(bm, faces, prop):
 def sort_verts_by_loops(face):
     """ sort verts in face clockwise using loops
     """
-    start_loop = max(face.loops, key=lambda loop: loop.vert.co.to_tuple()[:2])
+    # -- start from the loop with the largest (x, y), without building tuples
+    start_loop, bx, by = None, -math.inf, -math.inf
+    for loop in face.loops:
+        co = loop.vert.co
+        if co.x > bx or (co.x == bx and co.y > by):
+            start_loop, bx, by = loop, co.x, co.y
 
     verts = []
     current_loop = start_loop
@@ -163,21 +168,30 @@ def sort_verts_by_loops(face):
     return verts
 
 
-def vert_at_loc(loc, verts, loc_z=None):
+def loc_key(loc, ndigits=5):
+    """ Hashable key for the (x,y) position of loc
+    """
+    return round(loc.x, ndigits), round(loc.y, ndigits)
+
+
+def map_verts_by_loc(verts):
+    """ Group verts by their (x,y) location
+    """
+    loc_map = defaultdict(list)
+    for v in verts:
+        loc_map[loc_key(v.co)].append(v)
+    return loc_map
+
+
+def vert_at_loc(loc, loc_map, loc_z=None):
     """ Find all verts at loc(x,y), return the one with highest z coord
     """
-    results = []
-    for vert in verts:
-        co = vert.co
-        if equal(co.x, loc.x) and equal(co.y, loc.y):
-            if loc_z:
-                if equal(co.z, loc_z):
-                    results.append(vert)
-            else:
-                results.append(vert)
+    results = loc_map.get(loc_key(loc), ())
+    if loc_z:
+        results = [v for v in results if equal(v.co.z, loc_z)]
 
     if results:
-        return max([v for v in results], key=lambda v: v.co.z)
+        return max(results, key=lambda v: v.co.z)
     return None
 
 
@@ -185,24 +199,41 @@ def create_skeleton_verts_and_edges(bm, skeleton, original_edges, median, height
     """ Create the vertices and edges from output of straight skeleton
     """
     skeleton_edges = []
-    skeleton_verts = []
     O_verts = list({v for e in original_edges for v in e.verts})
+    loc_map = map_verts_by_loc(O_verts)
+
+    # -- index arc heights by the (x,y) of their source and sinks
+    source_heights = defaultdict(list)
+    sink_heights = defaultdict(list)
+    for arc in skeleton:
+        source_heights[(arc.source.x, arc.source.y)].append(arc.height)
+        for sink in arc.sinks:
+            sink_heights[(sink.x, sink.y)].append(arc.height)
+
+    # -- collect the locations that need new verts, first height seen wins
+    new_locs = {}
     for arc in skeleton:
         source = arc.source
-        vsource = vert_at_loc(source, O_verts + skeleton_verts)
-        if not vsource:
-            source_height = [arc.height for arc in skeleton if arc.source == source]
-            ht = source_height.pop() * height_scale
-            vsource = make_vert(bm, Vector((source.x, source.y, median.z + ht)))
-            skeleton_verts.append(vsource)
+        key = loc_key(source)
+        if key not in loc_map and key not in new_locs:
+            ht = source_heights[(source.x, source.y)][-1] * height_scale
+            new_locs[key] = (source.x, source.y, median.z + ht)
 
         for sink in arc.sinks:
-            vs = vert_at_loc(sink, O_verts + skeleton_verts)
-            if not vs:
-                sink_height = min([arc.height for arc in skeleton if sink in arc.sinks])
-                ht = height_scale * sink_height
-                vs = make_vert(bm, Vector((sink.x, sink.y, median.z + ht)))
-            skeleton_verts.append(vs)
+            key = loc_key(sink)
+            if key not in loc_map and key not in new_locs:
+                ht = height_scale * min(sink_heights[(sink.x, sink.y)])
+                new_locs[key] = (sink.x, sink.y, median.z + ht)
+
+    # -- create all the skeleton verts in one sweep
+    new_vert = bm.verts.new
+    for key, co in new_locs.items():
+        loc_map[key].append(new_vert(co))
+
+    for arc in skeleton:
+        vsource = vert_at_loc(arc.source, loc_map)
+        for sink in arc.sinks:
+            vs = vert_at_loc(sink, loc_map)
 
             # create edge
             if vs != vsource:
@@ -218,6 +249,9 @@ def create_skeleton_verts_and_edges(bm, skeleton, original_edges, median, height
 def create_skeleton_faces(bm, original_edges, skeleton_edges):
     """ Create faces formed from hiproof verts and edges
     """
+    skeleton_edges = set(skeleton_edges)
+    original_edges = validate(original_edges)
+    edge_map = {frozenset(e.verts): e for e in skeleton_edges.union(original_edges)}
 
     def interior_angle(vert, e1, e2):
         """ Determine anti-clockwise interior angle between edges
@@ -237,14 +271,15 @@ def create_skeleton_faces(bm, original_edges, skeleton_edges):
 
         previous = e
         found_edges = [e]
+        found = {e}
         while v != last:
             linked = [
-                e for e in v.link_edges if e in skeleton_edges and e not in found_edges
+                e for e in v.link_edges if e in skeleton_edges and e not in found
             ]
             if not linked:
-                common_edge = set(v.link_edges) & set(last.link_edges)
+                common_edge = edge_map.get(frozenset((v, last)))
                 if common_edge:
-                    found_edges.append(common_edge.pop())
+                    found_edges.append(common_edge)
                     break
                 # Re-walk if we have not reversed already, otherwise fail quietly
                 return boundary_walk(e, True) if not reverse else []
@@ -254,12 +289,13 @@ def create_skeleton_faces(bm, original_edges, skeleton_edges):
                 next_edge = min(linked, key=lambda e: interior_angle(v, previous, e))
             previous = next_edge
             found_edges.append(next_edge)
+            found.add(next_edge)
             v = next_edge.other_vert(v)
 
         return found_edges
 
     result = []
-    for ed in validate(original_edges):
+    for ed in original_edges:
         walk = boundary_walk(ed)
         if len(walk) < 3:
             # XXX Geometry error caused by intersecting roof edges
@@ -272,30 +308,34 @@ def create_skeleton_faces(bm, original_edges, skeleton_edges):
     return result
 
 
-def make_vert(bm, location):
-    """ Create a vertex at location
-    """
-    return bmesh.ops.create_vert(bm, co=location).get("vert").pop()
-
-
 def join_intersecting_verts_and_edges(bm, edges, verts):
     """ Find all vertices that intersect/ lie at an edge and merge
         them to that edge
     """
     eps = 0.0001
+    if not edges:
+        return []
+
+    # -- bucket edges into a 2D grid of cells covering their bounds
+    cell = max(sum(e.calc_length() for e in edges) / len(edges), eps)
+    grid = defaultdict(list)
+    for e in edges:
+        v1, v2 = e.verts
+        x0, x1 = sorted((v1.co.x, v2.co.x))
+        y0, y1 = sorted((v1.co.y, v2.co.y))
+        for i in range(math.floor((x0 - eps) / cell), math.floor((x1 + eps) / cell) + 1):
+            for j in range(math.floor((y0 - eps) / cell), math.floor((y1 + eps) / cell) + 1):
+                grid[i, j].append(e)
+
     new_verts = []
     for v in verts:
-        for e in edges:
+        key = math.floor(v.co.x / cell), math.floor(v.co.y / cell)
+        for e in grid.get(key, ()):
             if v in e.verts:
                 continue
 
             v1, v2 = e.verts
-            ortho = edge_vector(e).orthogonal().normalized() * eps
-            res = mathutils.geometry.intersect_line_line_2d(v.co, v.co, v1.co, v2.co)
-            if res is None:
-                res = mathutils.geometry.intersect_line_line_2d(v.co - ortho, v.co + ortho, v1.co, v2.co)
-
-            if res:
+            if point_on_segment_2d(v.co, v1.co, v2.co, eps):
                 split_vert = v1
                 split_factor = (v1.co - v.co).length / e.calc_length()
                 new_edge, new_vert = bmesh.utils.edge_split(e, split_vert, split_factor)
@@ -303,23 +343,19 @@ def join_intersecting_verts_and_edges(bm, edges, verts):
     return validate(new_verts)
 
 
-def get_linked_edges(verts, filter_edges):
-    """ Find all the edges linked to verts that are also in filter edges
+def point_on_segment_2d(p, a, b, tol=1e-5):
+    """ Check if point p lies on segment ab in the XY plane, within tol
     """
-    linked_edges = [e for v in verts for e in v.link_edges]
-    return list(filter(lambda e: e in filter_edges, linked_edges))
+    abx, aby = b.x - a.x, b.y - a.y
+    apx, apy = p.x - a.x, p.y - a.y
+    length_sq = abx * abx + aby * aby
+    if not length_sq:
+        return False
 
-
-def find_closest_pair_edges(edges_a, edges_b):
-    """ Find the edges in edges_a and edges_b that are closest to each other
-    """
-
-    def length_func(pair):
-        e1, e2 = pair
-        return (calc_edge_median(e1) - calc_edge_median(e2)).length
-
-    pairs = [(e1, e2) for e1 in edges_a for e2 in edges_b]
-    return sorted(pairs, key=length_func)[0]
+    # -- perpendicular distance from the line, then position along the segment
+    if abs(abx * apy - aby * apx) > tol * math.sqrt(length_sq):
+        return False
+    return 0.0 <= (apx * abx + apy * aby) / length_sq <= 1.0
 
 
 def join_intersections_and_get_skeleton_edges(bm, skeleton_verts, skeleton_edges):
@@ -339,6 +375,7 @@ def dissolve_lone_verts(bm, face, original_edges):
     def is_parallel(loop):
         return round(loop.calc_angle(), 2) == 3.14
 
+    original_edges = set(original_edges)
     parallel_verts = [loop.vert for loop in loops if is_parallel(loop)]
     lone_edges = [
         e for v in parallel_verts for e in v.link_edges if e not in original_edges
@@ -386,13 +423,14 @@ def gable_process_open(bm, roof_faces, prop):
     # -- find newly created side faces
     side_faces = []
     new_faces = filter_geom(result, BMFace)
+    new_faces_set = set(new_faces)
     for e in [ed for f in new_faces for ed in f.edges]:
         link_faces = e.link_faces
         len_valid = len(link_faces) == 2
-        link_valid = sum([f in new_faces for f in link_faces]) == 1
+        link_valid = sum([f in new_faces_set for f in link_faces]) == 1
 
         if len_valid and link_valid:
-            side_faces.extend(set(link_faces) - set(new_faces))
+            side_faces.extend(set(link_faces) - new_faces_set)
 
     # --determine upper bounding edges to be dissolved after outset
     dissolve_edges = []
@@ -413,8 +451,9 @@ def gable_process_open(bm, roof_faces, prop):
         v_edges.extend(list(filter(edge_is_vertical, f.edges)))
 
     # -- find ones with lowest z
-    min_z = min([calc_edge_median(e).z for e in v_edges])
-    min_z_edges = [e for e in v_edges if calc_edge_median(e).z == min_z]
+    median_z = [calc_edge_median(e).z for e in v_edges]
+    min_z = min(median_z)
+    min_z_edges = [e for e, z in zip(v_edges, median_z) if z == min_z]
     min_z_verts = list(set(v for e in min_z_edges for v in e.verts))
     bmesh.ops.translate(bm, verts=min_z_verts, vec=(0, 0, -prop.outset / 2))
 
@@ -449,12 +488,13 @@ def extrude_and_outset(bm, faces, thickness, outset):
     # -- outset the side faces from earlier extrusion
     link_faces = [f for e in top_face.edges for f in e.link_faces if f is not top_face]
 
-    bmesh.ops.inset_region(
+    inset_faces = bmesh.ops.inset_region(
         bm, faces=link_faces, depth=outset, use_even_offset=True
-    )
+    ).get("faces")
 
     # -- cleanup hidden faces
-    bmesh.ops.recalc_face_normals(bm, faces=bm.faces)
+    shell_faces = list(faces) + link_faces + inset_faces + [top_face]
+    bmesh.ops.recalc_face_normals(bm, faces=validate(shell_faces))
     bmesh.ops.delete(bm, geom=faces, context="FACES")
 
     new_faces = list({f for e in top_face.edges for f in e.link_faces})
@@ -7,6 +7,7 @@ from mathutils import Vector, Quaternion
 from ..railing.railing import create_railing
 from ...utils import (
     VEC_UP,
+    VEC_DOWN,
     FaceMap,
     vec_equal,
     local_xyz,
@@ -75,9 +76,9 @@ def create_filled_steps(bm, face, step_widths, step_height):
     for i, step_width in enumerate(step_widths):
         if i == 0:
             front_face, surrounding_faces = extrude_face(bm, front_face, step_width)
-            top_faces.append([f for f in surrounding_faces if vec_equal(f.normal, Vector((0., 0., 1.)))][0])
+            top_faces.append([f for f in surrounding_faces if vec_equal(f.normal, VEC_UP)][0])
         else:
-            bottom_face = list({f for e in front_face.edges for f in e.link_faces if vec_equal(f.normal, Vector((0., 0., -1.)))})[0]
+            bottom_face = list({f for e in front_face.edges for f in e.link_faces if vec_equal(f.normal, VEC_DOWN)})[0]
             top_face, front_face, _ = extrude_step(bm, bottom_face, normal, step_height, step_width)
             top_faces.append(top_face)
 
@@ -95,9 +96,9 @@ def create_blocked_steps(bm, face, step_widths, step_height):
     for i, step_width in enumerate(step_widths):
         if i == 0:
             front_face, surrounding_faces = extrude_face(bm, front_face, step_width)
-            top_faces.append([f for f in surrounding_faces if vec_equal(f.normal, Vector((0., 0., 1.)))][0])
+            top_faces.append([f for f in surrounding_faces if vec_equal(f.normal, VEC_UP)][0])
         else:
-            bottom_face = list({f for e in front_face.edges for f in e.link_faces if vec_equal(f.normal, Vector((0., 0., -1.)))})[0]
+            bottom_face = list({f for e in front_face.edges for f in e.link_faces if vec_equal(f.normal, VEC_DOWN)})[0]
             edges = filter_parallel_edges(bottom_face.edges, normal)
             widths = [edges[0].calc_length() - step_height, step_height]
 
@@ -121,9 +122,9 @@ def create_slope_steps(bm, face, step_widths, step_height):
     for i, step_width in enumerate(step_widths):
         if i == 0:
             front_face, surrounding_faces = extrude_face(bm, front_face, step_width)
-            top_faces.append([f for f in surrounding_faces if vec_equal(f.normal, Vector((0., 0., 1.)))][0])
+            top_faces.append([f for f in surrounding_faces if vec_equal(f.normal, VEC_UP)][0])
         else:
-            bottom_face = list({f for e in front_face.edges for f in e.link_faces if vec_equal(f.normal, Vector((0., 0., -1.)))})[0]
+            bottom_face = list({f for e in front_face.edges for f in e.link_faces if vec_equal(f.normal, VEC_DOWN)})[0]
 
             e1 = sort_edges(bottom_face.edges, normal)[0]
             edges = filter_parallel_edges(bottom_face.edges, normal)
@@ -154,8 +155,8 @@ def extrude_step(bm, face, normal, step_height, step_width):
     front_face, surrounding_faces = extrude_face(bm, front_face, step_width)
     flat_edges = list({e for f in surrounding_faces for e in f.edges if e.calc_face_angle() < 0.001 and e.calc_face_angle() > -0.001})
     bmesh.ops.dissolve_edges(bm, edges=flat_edges, use_verts=True)
-    top_face = list({f for e in front_face.edges for f in e.link_faces if vec_equal(f.normal, Vector((0., 0., 1.)))})[0]
-    bottom_face = list({f for e in front_face.edges for f in e.link_faces if vec_equal(f.normal, Vector((0., 0., -1.)))})[0]
+    top_face = list({f for e in front_face.edges for f in e.link_faces if vec_equal(f.normal, VEC_UP)})[0]
+    bottom_face = list({f for e in front_face.edges for f in e.link_faces if vec_equal(f.normal, VEC_DOWN)})[0]
 
     return top_face, front_face, bottom_face
 
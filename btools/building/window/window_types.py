@@ -109,7 +109,9 @@ def create_circular_frame(bm, face, prop):
     arc_edge(bm, end, res, -radius, xyz)
 
     # -- inset for frame thicknes
-    bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=0.0001)
+    bmesh.ops.remove_doubles(
+        bm, verts=list({v for f in faces for v in f.verts}), dist=0.0001
+    )
     res = bmesh.ops.inset_region(
         bm, faces=[mid], use_even_offset=True, thickness=prop.frame_thickness
     )
@@ -104,10 +104,17 @@ def valid_ngon(face):
 def is_rectangle(face):
     """ check if face is rectangular
     """
-    angles = [math.pi - l.calc_angle() for l in face.loops]
-    right_angles = len([a for a in angles if math.pi/2-0.001 < a < math.pi/2+0.001])
-    straight_angles = len([a for a in angles if -0.001 < a < 0.001])
-    return right_angles == 4 and straight_angles == len(angles) - 4
+    right_angles = 0
+    for l in face.loops:
+        a = math.pi - l.calc_angle()
+        if math.pi/2-0.001 < a < math.pi/2+0.001:
+            right_angles += 1
+            if right_angles > 4:
+                return False
+        elif not -0.001 < a < 0.001:
+            # -- neither a corner nor a straight run, can't be a rectangle
+            return False
+    return right_angles == 4
 
 
 def vec_equal(a, b):
@@ -207,13 +214,13 @@ def calc_face_dimensions(face):
 def face_with_verts(bm, verts, default=None):
     """ Find a face in the bmesh with the given verts
     """
-    for face in bm.faces:
-        equal = map(
-            operator.eq,
-            sorted(verts, key=operator.attrgetter("index")),
-            sorted(face.verts, key=operator.attrgetter("index")),
-        )
-        if len(face.verts) == len(verts) and all(equal):
+    if not verts:
+        return default
+
+    # -- any such face has to be linked to each of verts
+    vert_set = set(verts)
+    for face in verts[0].link_faces:
+        if len(face.verts) == len(vert_set) and vert_set.issuperset(face.verts):
             return face
     return default
 
@@ -274,15 +281,18 @@ def arc_edge(bm, edge, resolution, height, xyz, function="SPHERE"):
     orient *= (1 / orient.length)
     arc_direction.normalize()
 
+    # -- scaled axes, so each vert is written once
+    arc_offset = arc_direction * height
+    orient_offset = orient * (length / 2)
+
     def arc_sine(verts):
         for idx, v in enumerate(verts):
-            v.co += arc_direction * math.sin(theta * idx) * height
+            v.co += arc_offset * math.sin(theta * idx)
 
     def arc_sphere(verts):
         for idx, v in enumerate(verts):
             angle = math.pi - (theta * idx)
-            v.co = median + orient * math.cos(angle) * length / 2
-            v.co += arc_direction * math.sin(angle) * height
+            v.co = median + orient_offset * math.cos(angle) + arc_offset * math.sin(angle)
 
     {"SINE": arc_sine, "SPHERE": arc_sphere}.get(function)(verts)
     return ret
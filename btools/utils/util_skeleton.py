@@ -536,23 +536,23 @@ class LAVertex:
     def next_event(self):
         events = []
         if self.is_reflex:
+            # -- loop invariants, normalized once per vertex instead of per edge
+            left_dir = self.edge_left.v.normalized()
+            right_dir = self.edge_right.v.normalized()
             for edge in self.original_edges:
                 if edge.edge == self.edge_left or edge.edge == self.edge_right:
                     continue
 
-                leftdot = abs(
-                    self.edge_left.v.normalized().dot(edge.edge.v.normalized())
-                )
-                rightdot = abs(
-                    self.edge_right.v.normalized().dot(edge.edge.v.normalized())
-                )
+                edge_dir = edge.edge.v.normalized()
+                leftdot = abs(left_dir.dot(edge_dir))
+                rightdot = abs(right_dir.dot(edge_dir))
                 selfedge = self.edge_left if leftdot < rightdot else self.edge_right
 
                 i = Line2(selfedge).intersect(Line2(edge.edge))
                 if i is not None and not approximately_equals(i, self.point):
                     # locate candidate b
                     linvec = (self.point - i).normalized()
-                    edvec = edge.edge.v.normalized()
+                    edvec = edge_dir
                     if linvec.dot(edvec) < 0:
                         edvec = -edvec
 
@@ -579,10 +579,7 @@ class LAVertex:
                         )
                         < 0
                     )
-                    xedge = (
-                        cross(edge.edge.v.normalized(), (b - edge.edge.p).normalized())
-                        < 0
-                    )
+                    xedge = cross(edge_dir, (b - edge.edge.p).normalized()) < 0
 
                     if not (xleft and xright and xedge):
                         continue
@@ -660,6 +657,9 @@ class SLAV:
             )
             for vertex in it.chain.from_iterable(self._lavs)
         ]
+        self._original_points = {
+            p for e in self._original_edges for p in (e.edge.p1, e.edge.p2)
+        }
 
     def __iter__(self):
         for lav in self._lavs:
@@ -694,12 +694,8 @@ class SLAV:
 
         # -- gable roof processing
         if roof_is_gable():
-            original_points = []
-            for e in self._original_edges:
-                original_points.extend([e.edge.p1, e.edge.p2])
-
             len_sinks = len(sinks)
-            set_diff = set(sinks) - set(original_points)
+            set_diff = set(sinks) - self._original_points
             len_diff = len(list(set_diff))
 
             midpoint = event.intersection_point